@@ -2,13 +2,19 @@ import argparse
 import time
 import os
 from src.model import CisternModel
-from src.integrators import simulate
+try:
+    from src.fast import simulate_njit as simulate_compiled, FIXED_POINT
+except ImportError:
+    # No numba: fall back to the Cython build (python setup.py build_ext --inplace)
+    from src._fast import simulate_cython as simulate_compiled, FIXED_POINT
+from src.metrics import MetricsAccumulator
 from src.utils import save_metrics_csv, plot_results, save_simulation_results, ensure_dir
 
 def main():
     parser = argparse.ArgumentParser(description="Run Cistern Simulation with Fixed Point Iteration")
     parser.add_argument('--dt', type=float, default=0.1, help="Time step (s)")
     parser.add_argument('--t_end', type=float, default=300.0, help="End time (s)")
+    parser.add_argument('--no_warm_start', action='store_true', help="Start each nonlinear solve from the previous state instead of extrapolating")
     parser.add_argument('--save_dir', type=str, default='outputs', help="Output directory")
     parser.add_argument('--relaxation', type=float, default=1.0, help="Relaxation factor (1.0 = none)")
     args = parser.parse_args()
@@ -24,19 +30,26 @@ def main():
     u0 = model.u0
     
     print(f"Running Fixed-Point Simulation...")
-    print(f"dt={args.dt}, t_end={args.t_end}, relaxation={args.relaxation}")
+    print(f"dt={args.dt}, t_end={args.t_end}, relaxation={args.relaxation}, warm_start={not args.no_warm_start}")
+    
+    # One-step call so JIT compilation / cache loading is not timed
+    simulate_compiled(u0, 0.0, args.dt, 1, model.model_params(), FIXED_POINT, args.relaxation, not args.no_warm_start)
     
     start_time = time.time()
     
     # Run Simulation
-    times, states, metrics = simulate(
-        model, 
-        t_span, 
+    n_steps = int(round((t_span[1] - t_span[0]) / args.dt))
+    times, states, iters, converged = simulate_compiled(
         u0, 
+        t_span[0], 
         args.dt, 
-        method='fixed_point', 
-        relaxation=args.relaxation
+        n_steps, 
+        model.model_params(), 
+        FIXED_POINT, 
+        args.relaxation, 
+        not args.no_warm_start
     )
+    metrics = MetricsAccumulator.from_arrays(iters, converged)
     
     runtime = time.time() - start_time
     print(f"Done. Runtime: {runtime:.4f}s")
@@ -0,0 +1,69 @@
+import argparse
+import time
+import os
+from src.model import CisternModel
+from src.integrators import simulate
+from src.utils import save_metrics_csv, plot_results, save_simulation_results, ensure_dir
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Cistern Simulation with adaptive RK23 (Bogacki-Shampine)")
+    parser.add_argument('--dt', type=float, default=0.1, help="Initial time step (s), adapted afterwards")
+    parser.add_argument('--t_end', type=float, default=300.0, help="End time (s)")
+    parser.add_argument('--atol', type=float, default=1e-8, help="Absolute tolerance")
+    parser.add_argument('--rtol', type=float, default=1e-6, help="Relative tolerance")
+    parser.add_argument('--save_dir', type=str, default='outputs', help="Output directory")
+    args = parser.parse_args()
+    if args.dt <= 0:
+        parser.error("--dt must be positive")
+
+    # Setup
+    save_dir_figs = os.path.join(args.save_dir, 'figures')
+    save_dir_tables = os.path.join(args.save_dir, 'tables')
+    ensure_dir(save_dir_figs)
+    ensure_dir(save_dir_tables)
+    
+    model = CisternModel()
+    t_span = (0.0, args.t_end)
+    u0 = model.u0
+    
+    print(f"Running adaptive RK23 Simulation...")
+    print(f"dt0={args.dt}, t_end={args.t_end}, atol={args.atol}, rtol={args.rtol}")
+    
+    # One-step run so JIT compilation / cache loading is not timed
+    simulate(model, (0.0, args.dt), u0, args.dt, method='rk23_adaptive', atol=args.atol, rtol=args.rtol)
+    
+    start_time = time.time()
+    
+    # Run Simulation
+    times, states, metrics = simulate(
+        model, 
+        t_span, 
+        u0, 
+        args.dt, 
+        method='rk23_adaptive', 
+        atol=args.atol, 
+        rtol=args.rtol
+    )
+    
+    runtime = time.time() - start_time
+    print(f"Done. Runtime: {runtime:.4f}s, accepted steps: {len(times) - 1}")
+    
+    # Save Results
+    # In the metrics table Avg/Max_Iters count trial steps per accepted step
+    final_h = states[-1, 0]
+    save_metrics_csv(
+        os.path.join(save_dir_tables, 'metrics.csv'), 
+        'RK23', 
+        args.dt, 
+        metrics, 
+        runtime, 
+        final_h
+    )
+    
+    plot_results(times, states, 'RK23', save_dir_figs)
+    save_simulation_results(args.save_dir, times, states, 'RK23')
+    
+    print(f"Results saved to {args.save_dir}")
+
+if __name__ == "__main__":
+    main()
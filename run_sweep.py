@@ -0,0 +1,74 @@
+import argparse
+import time
+import os
+import numpy as np
+import numba
+from src.model import CisternModel
+from src.fast import simulate_sweep, FIXED_POINT, NEWTON_GS
+from src.utils import save_sweep_csv, ensure_dir
+
+METHODS = {'fixed_point': FIXED_POINT, 'newton_gs': NEWTON_GS}
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a parallel parameter sweep of the Cistern Simulation")
+    parser.add_argument('--method', type=str, default='newton_gs', choices=sorted(METHODS), help="Nonlinear solver")
+    parser.add_argument('--n_runs', type=int, default=1000, help="Number of parameter sets")
+    parser.add_argument('--dt', type=float, default=0.1, help="Time step (s)")
+    parser.add_argument('--t_end', type=float, default=300.0, help="End time (s)")
+    parser.add_argument('--relaxation', type=float, default=1.0, help="Relaxation factor for fixed_point (1.0 = none)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for parameter sampling")
+    parser.add_argument('--n_threads', type=int, default=None, help="Worker threads (default: NUMBA_NUM_THREADS)")
+    parser.add_argument('--no_warm_start', action='store_true', help="Start each nonlinear solve from the previous state instead of extrapolating")
+    parser.add_argument('--save_dir', type=str, default='outputs', help="Output directory")
+    args = parser.parse_args()
+    if args.n_threads is not None and not 1 <= args.n_threads <= numba.config.NUMBA_NUM_THREADS:
+        parser.error(f"--n_threads must be between 1 and {numba.config.NUMBA_NUM_THREADS}")
+
+    # Setup
+    save_dir_tables = os.path.join(args.save_dir, 'tables')
+    ensure_dir(save_dir_tables)
+    if args.n_threads is not None:
+        numba.set_num_threads(args.n_threads)
+    
+    # Perturb the uncertain parameters around their defaults
+    rng = np.random.default_rng(args.seed)
+    models = [
+        CisternModel({
+            'k_leak': rng.uniform(0.5e-5, 2.0e-5),
+            'h_target': rng.uniform(0.20, 0.30),
+            'k_valve': rng.uniform(1.0, 3.0),
+        })
+        for _ in range(args.n_runs)
+    ]
+    params = np.array([m.params_tuple() for m in models])
+    u0s = np.array([m.u0 for m in models], dtype=float)
+    n_steps = int(round(args.t_end / args.dt))
+    
+    print(f"Running parameter sweep ({args.method})...")
+    print(f"n_runs={args.n_runs}, dt={args.dt}, t_end={args.t_end}, threads={numba.get_num_threads()}")
+    
+    # One-step call so JIT compilation / cache loading is not timed
+    simulate_sweep(u0s[:1], params[:1], args.dt, 1, METHODS[args.method], args.relaxation, not args.no_warm_start)
+    
+    start_time = time.time()
+    
+    states, iters, converged = simulate_sweep(
+        u0s, 
+        params, 
+        args.dt, 
+        n_steps, 
+        METHODS[args.method], 
+        args.relaxation, 
+        not args.no_warm_start
+    )
+    
+    runtime = time.time() - start_time
+    print(f"Done. Runtime: {runtime:.4f}s")
+    
+    path = os.path.join(save_dir_tables, f'sweep_{args.method}.csv')
+    save_sweep_csv(path, params, states, iters, converged)
+    
+    print(f"Results saved to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+# Builds the optional Cython kernels (src/_fast.pyx) in place:
+#   python setup.py build_ext --inplace
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name='cistern_cp2',
+    ext_modules=cythonize(
+        [Extension('src._fast', ['src/_fast.pyx'])],
+        language_level=3,
+    ),
+)
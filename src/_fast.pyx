@@ -0,0 +1,224 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled (Cython) version of the Backward Euler kernels in
+src/fast.py, for environments where numba is not available.
+Build with: python setup.py build_ext --inplace
+"""
+import numpy as np
+from libc.math cimport sqrt, exp, fabs, fmax
+
+# Solver selectors, same values as src.fast
+FIXED_POINT = 0
+NEWTON_GS = 1
+
+# Same defaults as the pure-Python solvers in src/nonlinear_solvers.py
+cdef double FP_TOL_SQ = 1e-6 * 1e-6
+cdef int FP_MAX_ITER = 50
+cdef double NEWTON_TOL_SQ = 1e-6 * 1e-6
+cdef int NEWTON_MAX_ITER = 20
+cdef double GS_TOL_SQ = 1e-8 * 1e-8
+cdef int GS_MAX_ITER = 20
+
+cdef struct Params:
+    double h_target
+    double k_valve
+    double inv_A_Q
+    double inv_A_k
+    double half_inv_A_k
+    double inv_width
+
+
+cdef inline (double, double) rhs(double h, double v, Params* p) nogil:
+    cdef double safe_h = h if h > 1e-9 else 1e-9
+    cdef double dh_dt = p.inv_A_Q * v - p.inv_A_k * sqrt(safe_h)
+    cdef double arg = (h - p.h_target) * p.inv_width
+    if arg > 50.0:
+        arg = 50.0
+    elif arg < -50.0:
+        arg = -50.0
+    cdef double vt = 1.0 / (1.0 + exp(arg))
+    return dh_dt, p.k_valve * (vt - v)
+
+
+cdef inline (double, double, double, double, double, double) rhs_and_jac(
+        double h, double v, Params* p) nogil:
+    """rhs and jac fused, sharing sqrt(h) and the sigmoid exp."""
+    cdef double sqrt_h = sqrt(h if h > 1e-9 else 1e-9)
+    cdef double arg = (h - p.h_target) * p.inv_width
+    if arg > 50.0:
+        arg = 50.0
+    elif arg < -50.0:
+        arg = -50.0
+    cdef double ex = exp(arg)
+    cdef double vt = 1.0 / (1.0 + ex)
+    cdef double dvt_dh = -ex * vt * vt * p.inv_width
+    return (p.inv_A_Q * v - p.inv_A_k * sqrt_h, p.k_valve * (vt - v),
+            -p.half_inv_A_k / sqrt_h, p.inv_A_Q, p.k_valve * dvt_dh, -p.k_valve)
+
+
+cdef inline (double, double) solve2x2(double a00, double a01, double a10, double a11,
+                                      double b0, double b1) nogil:
+    """Closed-form 2x2 solve; Gauss-Seidel if nearly singular relative to the entries."""
+    cdef double det = a00 * a11 - a01 * a10
+    cdef double scale = fmax(fmax(fabs(a00), fabs(a01)), fmax(fabs(a10), fabs(a11)))
+    cdef double x0 = 0.0, x1 = 0.0, dx, dy
+    cdef int i
+    if fabs(det) > 1e-14 * scale * scale:
+        return (a11 * b0 - a01 * b1) / det, (a00 * b1 - a10 * b0) / det
+
+    for i in range(GS_MAX_ITER):
+        dx = x0
+        dy = x1
+        if fabs(a00) > 1e-12:
+            x0 = (b0 - a01 * x1) / a00
+        if fabs(a11) > 1e-12:
+            x1 = (b1 - a10 * x0) / a11
+        dx = x0 - dx
+        dy = x1 - dy
+        if dx * dx + dy * dy < GS_TOL_SQ:
+            break
+    return x0, x1
+
+
+cpdef void simulate_be_fp(double[:, :] states, long long[:] iters, unsigned char[:] converged,
+                          double u0_h, double u0_v, double prev_h, double prev_v, double dt,
+                          double h_target, double k_valve, double inv_A_Q, double inv_A_k,
+                          double half_inv_A_k, double inv_width, double relaxation,
+                          bint warm_start) noexcept nogil:
+    """Backward Euler + Fixed-Point over len(iters) steps, filling the output arrays."""
+    cdef Params p = Params(h_target, k_valve, inv_A_Q, inv_A_k, half_inv_A_k, inv_width)
+    cdef double h = u0_h, v = u0_v, h_prev = prev_h, v_prev = prev_v
+    cdef double h_g, v_g, h_new, v_new, dh_dt, dv_dt, dx, dy
+    cdef Py_ssize_t k
+    cdef int it
+    cdef unsigned char conv
+
+    states[0, 0] = h
+    states[0, 1] = v
+    for k in range(iters.shape[0]):
+        # Warm start from 2*u_n - u_{n-1}, cold start from u_n
+        if warm_start:
+            h_g = 2.0 * h - h_prev
+            v_g = 2.0 * v - v_prev
+        else:
+            h_g = h
+            v_g = v
+        h_prev = h
+        v_prev = v
+        conv = 0
+        it = 0
+        while it < FP_MAX_ITER:
+            it += 1
+            dh_dt, dv_dt = rhs(h_g, v_g, &p)
+            h_new = (1.0 - relaxation) * h_g + relaxation * (h + dt * dh_dt)
+            v_new = (1.0 - relaxation) * v_g + relaxation * (v + dt * dv_dt)
+            dx = h_new - h_g
+            dy = v_new - v_g
+            h_g = h_new
+            v_g = v_new
+            if dx * dx + dy * dy < FP_TOL_SQ:
+                conv = 1
+                break
+
+        h = h_g
+        v = v_g
+        states[k + 1, 0] = h
+        states[k + 1, 1] = v
+        iters[k] = it
+        converged[k] = conv
+
+
+cpdef void simulate_be_newton(double[:, :] states, long long[:] iters, unsigned char[:] converged,
+                              double u0_h, double u0_v, double prev_h, double prev_v, double dt,
+                              double h_target, double k_valve, double inv_A_Q, double inv_A_k,
+                              double half_inv_A_k, double inv_width, bint warm_start,
+                              bint has_prev) noexcept nogil:
+    """
+    Backward Euler + Newton (closed-form 2x2 update) over len(iters) steps.
+    (prev_h, prev_v) is only used if has_prev.
+    """
+    cdef Params p = Params(h_target, k_valve, inv_A_Q, inv_A_k, half_inv_A_k, inv_width)
+    cdef double h = u0_h, v = u0_v, h_prev = prev_h, v_prev = prev_v
+    cdef double h_g, v_g, dh_dt, dv_dt, F0, F1, d0, d1
+    cdef double j00, j01, j10, j11
+    cdef Py_ssize_t k
+    cdef int it
+    cdef unsigned char conv
+    cdef bint extrapolate = warm_start and has_prev
+
+    states[0, 0] = h
+    states[0, 1] = v
+    for k in range(iters.shape[0]):
+        # Warm start from 2*u_n - u_{n-1}, cold start from u_n
+        if extrapolate:
+            h_g = 2.0 * h - h_prev
+            v_g = 2.0 * v - v_prev
+        else:
+            h_g = h
+            v_g = v
+        h_prev = h
+        v_prev = v
+        conv = 0
+        it = 0
+        while it < NEWTON_MAX_ITER:
+            it += 1
+            dh_dt, dv_dt, j00, j01, j10, j11 = rhs_and_jac(h_g, v_g, &p)
+            F0 = h_g - h - dt * dh_dt
+            F1 = v_g - v - dt * dv_dt
+            # An extrapolated initial guess always gets at least one Newton update
+            if (it > 1 or not extrapolate) and F0 * F0 + F1 * F1 < NEWTON_TOL_SQ:
+                conv = 1
+                break
+
+            d0, d1 = solve2x2(1.0 - dt * j00, -dt * j01,
+                              -dt * j10, 1.0 - dt * j11,
+                              -F0, -F1)
+            h_g += d0
+            v_g += d1
+            if d0 * d0 + d1 * d1 < NEWTON_TOL_SQ:
+                conv = 1
+                break
+
+        h = h_g
+        v = v_g
+        states[k + 1, 0] = h
+        states[k + 1, 1] = v
+        iters[k] = it
+        converged[k] = conv
+        extrapolate = warm_start
+
+
+cdef void fill_times(double[:] times, double t, double dt) noexcept nogil:
+    """times[k] = t_start + dt + ... + dt, summed step by step."""
+    cdef Py_ssize_t k
+    times[0] = t
+    for k in range(1, times.shape[0]):
+        t = t + dt
+        times[k] = t
+
+
+def simulate_cython(u0, t_start, dt, n_steps, params, method_flag, relaxation, warm_start=True, u_prev=None):
+    """
+    Drop-in replacement for src.fast.simulate_njit (same arguments and returns).
+    params is a ModelParams, see CisternModel.model_params().
+    """
+    # Accumulated like simulate_njit so both backends return the same grid
+    times = np.empty(n_steps + 1)
+    fill_times(times, t_start, dt)
+    states = np.empty((n_steps + 1, 2))
+    iters = np.empty(n_steps, dtype=np.int64)
+    converged = np.empty(n_steps, dtype=np.uint8)
+    has_prev = u_prev is not None
+    if not has_prev:
+        u_prev = u0
+
+    if method_flag == FIXED_POINT:
+        simulate_be_fp(states, iters, converged, u0[0], u0[1], u_prev[0], u_prev[1], dt,
+                       params.h_target, params.k_valve, params.inv_A_Q, params.inv_A_k,
+                       params.half_inv_A_k, params.inv_width, relaxation, warm_start)
+    else:
+        simulate_be_newton(states, iters, converged, u0[0], u0[1], u_prev[0], u_prev[1], dt,
+                           params.h_target, params.k_valve, params.inv_A_Q, params.inv_A_k,
+                           params.half_inv_A_k, params.inv_width, warm_start, has_prev)
+
+    return times, states, iters, converged.view(np.bool_)
@@ -0,0 +1,269 @@
+import math
+import numpy as np
+from numba import njit, prange
+from src.model import ModelParams
+
+# Solver selectors for simulate_njit (numba cannot dispatch on strings cheaply)
+FIXED_POINT = 0
+NEWTON_GS = 1
+
+# Same defaults as the pure-Python solvers in src/nonlinear_solvers.py
+FP_TOL = 1e-6
+FP_MAX_ITER = 50
+NEWTON_TOL = 1e-6
+NEWTON_MAX_ITER = 20
+GS_TOL = 1e-8
+GS_MAX_ITER = 20
+
+# Convergence checks compare squared norms against these
+FP_TOL_SQ = FP_TOL * FP_TOL
+NEWTON_TOL_SQ = NEWTON_TOL * NEWTON_TOL
+GS_TOL_SQ = GS_TOL * GS_TOL
+
+
+@njit(cache=True)
+def f_njit(h, v, p):
+    """Scalar version of CisternModel.f, p is a ModelParams. Returns (dh_dt, dv_dt)."""
+    safe_h = max(h, 1e-9)
+    dh_dt = p.inv_A_Q * v - p.inv_A_k * math.sqrt(safe_h)
+
+    arg = (h - p.h_target) * p.inv_width
+    arg = min(max(arg, -50.0), 50.0)
+    vt = 1.0 / (1.0 + math.exp(arg))
+    dv_dt = p.k_valve * (vt - v)
+
+    return dh_dt, dv_dt
+
+
+@njit(cache=True)
+def f_and_jac_njit(h, v, p):
+    """
+    f_njit and the Jacobian (J00, J01, J10, J11) of f from one evaluation,
+    sharing sqrt(h) and the sigmoid exp. Returns (dh_dt, dv_dt, J00, J01, J10, J11).
+    """
+    sqrt_h = math.sqrt(max(h, 1e-9))
+
+    arg = (h - p.h_target) * p.inv_width
+    arg = min(max(arg, -50.0), 50.0)
+    ex = math.exp(arg)
+    vt = 1.0 / (1.0 + ex)
+    dvt_dh = -ex * vt * vt * p.inv_width
+
+    dh_dt = p.inv_A_Q * v - p.inv_A_k * sqrt_h
+    dv_dt = p.k_valve * (vt - v)
+
+    return (dh_dt, dv_dt,
+            -p.half_inv_A_k / sqrt_h, p.inv_A_Q,
+            p.k_valve * dvt_dh, -p.k_valve)
+
+
+@njit(cache=True)
+def gs2x2_njit(a00, a01, a10, a11, b0, b1):
+    """Gauss-Seidel for a 2x2 system, starting from x = 0."""
+    x0 = 0.0
+    x1 = 0.0
+
+    for _ in range(GS_MAX_ITER):
+        x0_old = x0
+        x1_old = x1
+
+        if abs(a00) > 1e-12:
+            x0 = (b0 - a01 * x1) / a00
+        if abs(a11) > 1e-12:
+            x1 = (b1 - a10 * x0) / a11
+
+        dx = x0 - x0_old
+        dy = x1 - x1_old
+        if dx * dx + dy * dy < GS_TOL_SQ:
+            break
+
+    return x0, x1
+
+
+@njit(cache=True)
+def solve2x2_njit(a00, a01, a10, a11, b0, b1):
+    """Closed-form (Cramer's rule) 2x2 solve; Gauss-Seidel if nearly singular relative to the entries."""
+    det = a00 * a11 - a01 * a10
+    scale = max(abs(a00), abs(a01), abs(a10), abs(a11))
+    if abs(det) <= 1e-14 * scale * scale:
+        return gs2x2_njit(a00, a01, a10, a11, b0, b1)
+    return (a11 * b0 - a01 * b1) / det, (a00 * b1 - a10 * b0) / det
+
+
+@njit(cache=True)
+def fp_step_njit(h_old, v_old, h_init, v_init, dt, params, relaxation):
+    """One Backward Euler step solved with Fixed-Point iteration, starting from (h_init, v_init)."""
+    h_g = h_init
+    v_g = v_init
+    iters = 0
+    converged = False
+
+    for _ in range(FP_MAX_ITER):
+        iters += 1
+
+        dh_dt, dv_dt = f_njit(h_g, v_g, params)
+        h_new = (1.0 - relaxation) * h_g + relaxation * (h_old + dt * dh_dt)
+        v_new = (1.0 - relaxation) * v_g + relaxation * (v_old + dt * dv_dt)
+
+        dx = h_new - h_g
+        dy = v_new - v_g
+        h_g = h_new
+        v_g = v_new
+        if dx * dx + dy * dy < FP_TOL_SQ:
+            converged = True
+            break
+
+    return h_g, v_g, iters, converged
+
+
+@njit(cache=True)
+def newton_step_njit(h_old, v_old, h_init, v_init, dt, params, extrapolated):
+    """
+    One Backward Euler step solved with Newton (closed-form 2x2 update), starting from (h_init, v_init).
+    An extrapolated initial guess always gets at least one Newton update.
+    """
+    h_g = h_init
+    v_g = v_init
+    iters = 0
+    converged = False
+
+    for _ in range(NEWTON_MAX_ITER):
+        iters += 1
+
+        # Residual F = u - u_old - dt * f(u), J_f from the same evaluation
+        dh_dt, dv_dt, j00, j01, j10, j11 = f_and_jac_njit(h_g, v_g, params)
+        F0 = h_g - h_old - dt * dh_dt
+        F1 = v_g - v_old - dt * dv_dt
+
+        if (iters > 1 or not extrapolated) and F0 * F0 + F1 * F1 < NEWTON_TOL_SQ:
+            converged = True
+            break
+
+        # J_F = I - dt * J_f
+        d0, d1 = solve2x2_njit(1.0 - dt * j00, -dt * j01,
+                               -dt * j10, 1.0 - dt * j11,
+                               -F0, -F1)
+
+        h_g += d0
+        v_g += d1
+
+        if d0 * d0 + d1 * d1 < NEWTON_TOL_SQ:
+            converged = True
+            break
+
+    return h_g, v_g, iters, converged
+
+
+@njit(cache=True)
+def _simulate_into(h, v, h_prev, v_prev, has_prev, dt, params, method_flag, relaxation, warm_start,
+                   states, iters, converged):
+    """
+    Runs len(iters) steps from (h, v), writing into preallocated output arrays.
+    With warm_start each solve starts from 2*u_n - u_{n-1}, otherwise from u_n;
+    (h_prev, v_prev) is the state one step before (h, v), only used if has_prev.
+    """
+    states[0, 0] = h
+    states[0, 1] = v
+    extrapolate = warm_start and has_prev
+
+    for k in range(iters.shape[0]):
+        if extrapolate:
+            h_init = 2.0 * h - h_prev
+            v_init = 2.0 * v - v_prev
+        else:
+            h_init = h
+            v_init = v
+        h_prev = h
+        v_prev = v
+        if method_flag == FIXED_POINT:
+            h, v, it, conv = fp_step_njit(h, v, h_init, v_init, dt, params, relaxation)
+        else:
+            h, v, it, conv = newton_step_njit(h, v, h_init, v_init, dt, params, extrapolate)
+
+        states[k + 1, 0] = h
+        states[k + 1, 1] = v
+        iters[k] = it
+        converged[k] = conv
+        extrapolate = warm_start
+
+
+@njit(cache=True, nogil=True)
+def simulate_njit(u0, t_start, dt, n_steps, params, method_flag, relaxation, warm_start=True, u_prev=None):
+    """
+    Compiled equivalent of integrators.simulate. The whole time loop runs
+    without returning to the interpreter, and releases the GIL so several
+    calls can run concurrently from Python threads.
+
+    Args:
+        u0: Initial state [h, v]
+        t_start: Initial time
+        dt: Time step
+        n_steps: Number of Backward Euler steps
+        params: ModelParams, see CisternModel.model_params()
+        method_flag: FIXED_POINT or NEWTON_GS
+        relaxation: Fixed-Point damping factor (ignored by Newton)
+        warm_start: Start each solve from the extrapolation 2*u_n - u_{n-1}
+        u_prev: State one step before u0, for the first warm start (default u0)
+
+    Returns:
+        times: array (n_steps+1,)
+        states: array (n_steps+1, 2)
+        iters: nonlinear iterations per step, array (n_steps,)
+        converged: convergence flag per step, array (n_steps,)
+    """
+    times = np.empty(n_steps + 1)
+    states = np.empty((n_steps + 1, 2))
+    iters = np.empty(n_steps, dtype=np.int64)
+    converged = np.empty(n_steps, dtype=np.bool_)
+
+    t = t_start
+    times[0] = t
+    for k in range(n_steps):
+        t = t + dt
+        times[k + 1] = t
+
+    if u_prev is None:
+        _simulate_into(u0[0], u0[1], u0[0], u0[1], False, dt, params, method_flag, relaxation, warm_start,
+                       states, iters, converged)
+    else:
+        _simulate_into(u0[0], u0[1], u_prev[0], u_prev[1], True, dt, params, method_flag, relaxation, warm_start,
+                       states, iters, converged)
+
+    return times, states, iters, converged
+
+
+@njit(cache=True)
+def params_from_row(row):
+    """Builds ModelParams from a params_tuple()-ordered array row."""
+    A, Q_max, h_target, k_valve, k_leak, width_s = row[0], row[1], row[2], row[3], row[4], row[5]
+    return ModelParams(A, Q_max, h_target, k_valve, k_leak, width_s,
+                       Q_max / A, k_leak / A, 0.5 * k_leak / A, 1.0 / width_s)
+
+
+@njit(parallel=True, cache=True)
+def simulate_sweep(u0s, params_mat, dt, n_steps, method_flag, relaxation, warm_start=True):
+    """
+    Runs M independent simulations in parallel, one per row of params_mat.
+    Thread count follows NUMBA_NUM_THREADS / numba.set_num_threads.
+
+    Args:
+        u0s: Initial states, array (M, 2)
+        params_mat: array (M, 6), rows in CisternModel.params_tuple() order
+        dt, n_steps, method_flag, relaxation, warm_start: as in simulate_njit
+
+    Returns:
+        states: array (M, n_steps+1, 2)
+        iters: array (M, n_steps)
+        converged: array (M, n_steps)
+    """
+    M = params_mat.shape[0]
+    states = np.empty((M, n_steps + 1, 2))
+    iters = np.empty((M, n_steps), dtype=np.int64)
+    converged = np.empty((M, n_steps), dtype=np.bool_)
+
+    for m in prange(M):
+        params = params_from_row(params_mat[m])
+        _simulate_into(u0s[m, 0], u0s[m, 1], u0s[m, 0], u0s[m, 1], False, dt, params, method_flag, relaxation,
+                       warm_start, states[m], iters[m], converged[m])
+
+    return states, iters, converged
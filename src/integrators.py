@@ -1,53 +1,161 @@
 from src.nonlinear_solvers import solve_fixed_point, solve_newton_gs
+from src.metrics import MetricsAccumulator
 import numpy as np
 
 def backward_euler_step(u_current, t_current, dt, model, method='fixed_point', **kwargs):
     """
     Performs one time step of Implicit Backward Euler integration.
     u_{n+1} = u_n + dt * f(t_{n+1}, u_{n+1})
+    
+    Returns (t_next, u_next, iters, converged).
     """
     t_next = t_current + dt
     
     if method == 'fixed_point':
-        u_next, metrics = solve_fixed_point(u_current, dt, t_next, model, **kwargs)
+        u_next, iters, converged = solve_fixed_point(u_current, dt, t_next, model, **kwargs)
     elif method == 'newton_gs':
-        u_next, metrics = solve_newton_gs(u_current, dt, t_next, model, **kwargs)
+        u_next, iters, converged = solve_newton_gs(u_current, dt, t_next, model, **kwargs)
     else:
         raise ValueError(f"Unknown nonlinear solver method: {method}")
         
-    return t_next, u_next, metrics
+    return t_next, u_next, iters, converged
 
-def simulate(model, t_span, u0, dt, method='fixed_point', **solver_kwargs):
+def simulate(model, t_span, u0, dt, method='fixed_point', warm_start=True, **solver_kwargs):
     """
     Simulates the system over t_span = [t_start, t_end].
+    With warm_start, each nonlinear solve starts from the linear extrapolation
+    2*u_n - u_{n-1} of the last two steps instead of u_n.
+    method='rk23_adaptive' switches to the adaptive explicit RK23 in src.rk23
+    (dt is then the initial step, solver_kwargs may set atol / rtol).
     
     Returns:
-        times: array of time points
-        states: array of states (N, 2)
-        metrics_list: list of metric dicts for each step
+        times: array of time points (N+1,)
+        states: array of states (N+1, 2)
+        metrics: MetricsAccumulator with iteration / failure statistics
     """
-    t_start, t_end = t_span
+    if method == 'rk23_adaptive':
+        from src.rk23 import simulate_rk23 # needs numba, only imported when used
+        return simulate_rk23(model, t_span, u0, dt, **solver_kwargs)
     
-    times = [t_start]
-    states = [u0]
-    metrics_list = []
-    
-    t = t_start
-    u = u0.copy()
+    t_start, t_end = t_span
     
     # Simple fixed time stepping
     # Calculate number of steps to avoid theoretical float drift issues in simple loop
     n_steps = int(round((t_end - t_start) / dt))
     
-    for _ in range(n_steps):
-        t_next, u_next, metrics = backward_euler_step(u, t, dt, model, method, **solver_kwargs)
+    times = np.empty(n_steps + 1)
+    states = np.empty((n_steps + 1, 2))
+    metrics = MetricsAccumulator()
+    
+    times[0] = t_start
+    states[0] = u0
+    
+    t = t_start
+    u = u0 # Solvers work on scalar copies of u_old, no defensive copy needed
+    u_prev = None
+    
+    for k in range(n_steps):
+        if warm_start and u_prev is not None:
+            solver_kwargs['u_guess'] = (2.0 * u[0] - u_prev[0], 2.0 * u[1] - u_prev[1])
+        t_next, u_next, iters, converged = backward_euler_step(u, t, dt, model, method, **solver_kwargs)
         
-        times.append(t_next)
-        states.append(u_next)
-        metrics_list.append(metrics)
+        times[k + 1] = t_next
+        states[k + 1] = u_next
+        metrics.add(iters, converged)
         
         # Update for next step
         t = t_next
+        u_prev = u
         u = u_next
         
-    return np.array(times), np.array(states), metrics_list
+    return times, states, metrics
+
+
+def simulate_batch(params, u0s, t_span, dt, tol=1e-6, max_iter=50, relaxation=1.0, warm_start=True):
+    """
+    Simulates M independent cisterns at once with Backward Euler + Fixed-Point.
+    State is kept as separate h[M], v[M] arrays so every operation in the
+    inner iteration is a single vectorized NumPy call over the batch.
+    
+    Args:
+        params: array (M, 6), rows in CisternModel.params_tuple() order
+                (A, Q_max, h_target, k_valve, k_leak, width_s)
+        u0s: array (M, 2) of initial states
+        t_span, dt, tol, max_iter, relaxation, warm_start: as in simulate / solve_fixed_point
+        
+    Returns:
+        times: array of time points (N+1,)
+        states: array of states (N+1, M, 2)
+        iters: iterations per step and cistern (N, M)
+        converged: convergence flag per step and cistern (N, M)
+    """
+    params = np.asarray(params, dtype=float)
+    u0s = np.asarray(u0s, dtype=float)
+    M = params.shape[0]
+    
+    A, Q_max, h_target, k_valve, k_leak, width_s = params.T
+    inv_A_Q = Q_max / A
+    inv_A_k = k_leak / A
+    inv_w = 1.0 / width_s
+    tol_sq = tol * tol
+    
+    t_start, t_end = t_span
+    n_steps = int(round((t_end - t_start) / dt))
+    
+    times = t_start + dt * np.arange(n_steps + 1)
+    states = np.empty((n_steps + 1, M, 2))
+    iters = np.zeros((n_steps, M), dtype=int)
+    converged = np.zeros((n_steps, M), dtype=bool)
+    
+    h = u0s[:, 0].copy()
+    v = u0s[:, 1].copy()
+    states[0, :, 0] = h
+    states[0, :, 1] = v
+    
+    # Scratch buffers for the iterate, reused across all steps
+    h_g = np.empty(M)
+    v_g = np.empty(M)
+    
+    for k in range(n_steps):
+        if warm_start and k > 0:
+            # 2*u_n - u_{n-1}, u_{n-1} is still in states
+            np.multiply(h, 2.0, out=h_g)
+            np.multiply(v, 2.0, out=v_g)
+            h_g -= states[k - 1, :, 0]
+            v_g -= states[k - 1, :, 1]
+        else:
+            np.copyto(h_g, h)
+            np.copyto(v_g, v)
+        it = iters[k]
+        conv = converged[k]
+        
+        for _ in range(max_iter):
+            active = ~conv
+            if not active.any():
+                break
+            
+            # G(u) = u_old + dt * f(u), evaluated for the whole batch
+            safe_h = np.maximum(h_g, 1e-9)
+            dh = inv_A_Q * v_g - inv_A_k * np.sqrt(safe_h)
+            arg = np.clip((h_g - h_target) * inv_w, -50, 50)
+            vt = 1.0 / (1.0 + np.exp(arg))
+            dv = k_valve * (vt - v_g)
+            
+            h_new = (1.0 - relaxation) * h_g + relaxation * (h + dt * dh)
+            v_new = (1.0 - relaxation) * v_g + relaxation * (v + dt * dv)
+            dx = h_new - h_g
+            dy = v_new - v_g
+            diff_sq = dx * dx + dy * dy
+            
+            # Rows that already converged stay frozen
+            np.copyto(h_g, h_new, where=active)
+            np.copyto(v_g, v_new, where=active)
+            it += active
+            conv |= active & (diff_sq < tol_sq)
+            
+        np.copyto(h, h_g)
+        np.copyto(v, v_g)
+        states[k + 1, :, 0] = h
+        states[k + 1, :, 1] = v
+        
+    return times, states, iters, converged
@@ -0,0 +1,42 @@
+import numpy as np
+
+class MetricsAccumulator:
+    """
+    Running summary of nonlinear solver statistics over a simulation.
+    Updated once per time step, so memory stays O(1) in the number of steps.
+    """
+    def __init__(self):
+        self.n_steps = 0
+        self.sum_iters = 0
+        self.max_iters = 0
+        self.failures = 0
+
+    def add(self, iters, converged):
+        """Records one time step."""
+        self.n_steps += 1
+        self.sum_iters += iters
+        if iters > self.max_iters:
+            self.max_iters = iters
+        if not converged:
+            self.failures += 1
+
+    @property
+    def avg_iters(self):
+        return self.sum_iters / self.n_steps if self.n_steps else 0.0
+
+    @classmethod
+    def from_arrays(cls, iters, converged=None):
+        """
+        Builds the summary from per-step arrays (e.g. from the numba kernels).
+        Reads each array once and creates no temporaries.
+        converged=None counts every step as converged.
+        """
+        acc = cls()
+        iters = np.asarray(iters)
+        acc.n_steps = len(iters)
+        if acc.n_steps:
+            acc.sum_iters = int(iters.sum())
+            acc.max_iters = int(iters.max())
+            if converged is not None:
+                acc.failures = acc.n_steps - int(np.count_nonzero(converged))
+        return acc
@@ -1,5 +1,14 @@
+from math import sqrt, exp
+from collections import namedtuple
 import numpy as np
 
+# Immutable parameter record for the compiled kernels in src.fast.
+# Numba types every field as float64 and resolves p.A etc. at compile time.
+ModelParams = namedtuple('ModelParams', [
+    'A', 'Q_max', 'h_target', 'k_valve', 'k_leak', 'width_s',
+    'inv_A_Q', 'inv_A_k', 'half_inv_A_k', 'inv_width'
+])
+
 class CisternModel:
     """
     Models the filling dynamics of a toilet cistern with a float valve.
@@ -30,6 +39,23 @@ class CisternModel:
         
         # Initial condition default
         self.u0 = np.array(config.get('u0', [0.0, 1.0])) # Empty tank, valve open
+        
+        # Derived constants, hoisted out of f / jacobian
+        self._inv_A_Q = self.Q_max / self.A
+        self._inv_A_k = self.k_leak / self.A
+        self._half_inv_A_k = 0.5 * self.k_leak / self.A
+        self._inv_width = 1.0 / self.width_s
+
+    def params_tuple(self):
+        """Physical parameters as a plain tuple (row layout used for parameter arrays)."""
+        return (self.A, self.Q_max, self.h_target, self.k_valve, self.k_leak, self.width_s)
+
+    def model_params(self):
+        """Parameters plus derived constants as a ModelParams, for src.fast."""
+        return ModelParams(
+            self.A, self.Q_max, self.h_target, self.k_valve, self.k_leak, self.width_s,
+            self._inv_A_Q, self._inv_A_k, self._half_inv_A_k, self._inv_width
+        )
 
     def v_target_func(self, h):
         """
@@ -37,75 +63,115 @@ class CisternModel:
         Ideally 1 when h << h_target, 0 when h >> h_target.
         Using sigmoid: 1 / (1 + exp((h - h_target)/width))
         But we want it to close as h increases.
+        Works on scalars or NumPy arrays; the solvers use _sigmoid_and_deriv.
         """
         # Sigmoid that goes from 1 to 0 around h_target
         # x = (h - h_target) / width_s
         # f(x) = 1 / (1 + exp(x))  -> 1 when h small (x neg big), 0 when h big (x pos big)
         
         # Avoid overflow in exp
-        arg = (h - self.h_target) / self.width_s
+        arg = (h - self.h_target) * self._inv_width
         arg = np.clip(arg, -50, 50) 
         return 1.0 / (1.0 + np.exp(arg))
 
     def dv_target_dh(self, h):
         """Derivative of v_target_func with respect to h."""
-        arg = (h - self.h_target) / self.width_s
+        arg = (h - self.h_target) * self._inv_width
         arg = np.clip(arg, -50, 50)
         ex = np.exp(arg)
         # d/dh [ (1+e^u)^-1 ] = -1 * (1+e^u)^-2 * e^u * du/dh
         # du/dh = 1/width_s
-        denom = (1.0 + ex)**2
-        return -ex / denom / self.width_s
+        return -ex * self._inv_width / (1.0 + ex)**2
 
-    def f(self, t, u):
+    def _sigmoid_and_deriv(self, h):
         """
-        System RHS: u' = f(t, u)
-        u[0] = h
-        u[1] = v
+        Scalar fast path: returns (v_target(h), dv_target/dh) from a single exp.
+        Uses dvt/dh = -vt*(1-vt)/width_s, with 1-vt written as ex*vt so it
+        stays accurate when vt is close to 1.
+        """
+        arg = (h - self.h_target) * self._inv_width
+        arg = max(-50.0, min(50.0, arg))
+        ex = exp(arg)
+        vt = 1.0 / (1.0 + ex)
+        return vt, -ex * vt * vt * self._inv_width
+
+    def f_scalar(self, t, h, v):
+        """
+        System RHS on scalar states.
+        Returns (dh_dt, dv_dt) as a tuple to avoid allocating an array per call.
         """
-        h = u[0]
-        v = u[1]
-        
         # 1. dh/dt = (Qin - Qout) / A
-        # Q_in = Q_max * v
-        # Q_out = k_leak * sqrt(h)
+        # Q_in / A = (Q_max / A) * v
+        # Q_out / A = (k_leak / A) * sqrt(h)
         safe_h = max(h, 1e-9) # Avoid sqrt(negative)
-        q_in = self.Q_max * v
-        q_out = self.k_leak * np.sqrt(safe_h)
-        dh_dt = (q_in - q_out) / self.A
+        q_in = self._inv_A_Q * v
+        q_out = self._inv_A_k * sqrt(safe_h)
+        dh_dt = q_in - q_out
         
         # 2. dv/dt = k_valve * (v_target - v)
         # Valve tries to match the target opening for current height
-        vt = self.v_target_func(h)
+        vt, _ = self._sigmoid_and_deriv(h)
         dv_dt = self.k_valve * (vt - v)
         
-        return np.array([dh_dt, dv_dt])
+        return dh_dt, dv_dt
 
-    def jacobian(self, t, u):
+    def f(self, t, u):
         """
-        Analytic Jacobian Matrix J = df/du
-        J[i, j] = df_i / du_j
+        System RHS: u' = f(t, u)
+        u[0] = h
+        u[1] = v
+        """
+        return np.array(self.f_scalar(t, u[0], u[1]))
+
+    def jacobian_scalar(self, t, h, v):
+        """
+        Analytic Jacobian entries on scalar states.
+        Returns (df1_dh, df1_dv, df2_dh, df2_dv).
         
         f1 = (Q_max*v - k_leak*sqrt(h)) / A
         f2 = k_valve * (v_target(h) - v)
         """
-        h = u[0]
-        v = u[1]
-        
         safe_h = max(h, 1e-9)
         
         # df1 / dh = - (k_leak / A) * (1 / (2*sqrt(h)))
-        df1_dh = -(self.k_leak / self.A) * (0.5 / np.sqrt(safe_h))
+        df1_dh = -self._half_inv_A_k / sqrt(safe_h)
         
         # df1 / dv = Q_max / A
-        df1_dv = self.Q_max / self.A
+        df1_dv = self._inv_A_Q
         
         # df2 / dh = k_valve * dv_target_dh(h)
-        df2_dh = self.k_valve * self.dv_target_dh(h)
+        _, dvt_dh = self._sigmoid_and_deriv(h)
+        df2_dh = self.k_valve * dvt_dh
         
         # df2 / dv = -k_valve
         df2_dv = -self.k_valve
         
+        return df1_dh, df1_dv, df2_dh, df2_dv
+
+    def f_and_jacobian_scalar(self, t, h, v):
+        """
+        f_scalar and jacobian_scalar in one pass, sharing sqrt(h) and the sigmoid exp.
+        Returns (dh_dt, dv_dt, df1_dh, df1_dv, df2_dh, df2_dv).
+        """
+        sqrt_h = sqrt(max(h, 1e-9))
+        vt, dvt_dh = self._sigmoid_and_deriv(h)
+        
+        dh_dt = self._inv_A_Q * v - self._inv_A_k * sqrt_h
+        dv_dt = self.k_valve * (vt - v)
+        
+        return (
+            dh_dt, dv_dt,
+            -self._half_inv_A_k / sqrt_h, self._inv_A_Q,
+            self.k_valve * dvt_dh, -self.k_valve
+        )
+
+    def jacobian(self, t, u):
+        """
+        Analytic Jacobian Matrix J = df/du
+        J[i, j] = df_i / du_j
+        """
+        df1_dh, df1_dv, df2_dh, df2_dv = self.jacobian_scalar(t, u[0], u[1])
+        
         J = np.array([
             [df1_dh, df1_dv],
             [df2_dh, df2_dv]
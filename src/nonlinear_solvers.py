@@ -1,120 +1,159 @@
-import numpy as np
-
-def solve_fixed_point(u_old, dt, t_next, model, tol=1e-6, max_iter=50, relaxation=1.0):
+def solve_fixed_point(u_old, dt, t_next, model, tol=1e-6, max_iter=50, relaxation=1.0, u_guess=None):
     """
     Solves the implicit equation u = u_old + dt * f(t_next, u) using Fixed Point Iteration.
-    
+
     Args:
-        u_old: State at previous step
+        u_old: State at previous step (h, v)
         dt: Time step
         t_next: Time at next step
-        model: Physics model (has .f(t,u))
+        model: Physics model (has .f_scalar(t,h,v))
         tol: Convergence tolerance for norm(change)
         max_iter: Max iterations
         relaxation: Damping factor omega (0 < omega <= 1). u_new = (1-w)*u_prev + w*G(u_prev)
-        
+        u_guess: Initial iterate (defaults to u_old)
+
     Returns:
-        u_next: Converged solution
-        metrics: dict with 'iters', 'converged'
+        u_next: Converged solution as a tuple (h, v)
+        iters: Number of iterations used
+        converged: Whether the tolerance was reached
     """
-    u_guess = u_old.copy() # Initial guess is previous step
-    
+    h_old, v_old = u_old
+    h_g, v_g = u_old if u_guess is None else u_guess # Initial guess, previous step by default
+    tol_sq = tol * tol # Compare squared norms, no sqrt needed
+
     iters = 0
     converged = False
-    
+
     for i in range(max_iter):
         iters += 1
-        
+
         # G(u) = u_old + dt * f(t_next, u)
-        g_val = u_old + dt * model.f(t_next, u_guess)
-        
+        dh_dt, dv_dt = model.f_scalar(t_next, h_g, v_g)
+        g_h = h_old + dt * dh_dt
+        g_v = v_old + dt * dv_dt
+
         # Update with relaxation: u_{k+1} = (1-w)u_k + w*G(u_k)
-        u_new = (1.0 - relaxation) * u_guess + relaxation * g_val
-        
+        h_new = (1.0 - relaxation) * h_g + relaxation * g_h
+        v_new = (1.0 - relaxation) * v_g + relaxation * g_v
+
         # Check convergence
-        diff = np.linalg.norm(u_new - u_guess)
-        if diff < tol:
+        dx = h_new - h_g
+        dy = v_new - v_g
+        h_g, v_g = h_new, v_new
+        if dx * dx + dy * dy < tol_sq:
             converged = True
-            u_guess = u_new
             break
-            
-        u_guess = u_new
-        
-    return u_guess, {'iters': iters, 'converged': converged}
+
+    return (h_g, v_g), iters, converged
 
 
-def gauss_seidel_2x2_solve(A, b, x_guess, tol=1e-8, max_iter=20):
+def gauss_seidel_2x2_solve(a00, a01, a10, a11, b0, b1, x0=0.0, x1=0.0, tol=1e-8, max_iter=20):
     """
     Solves Ax = b for x using Gauss-Seidel for a 2x2 system.
     Manual implementation as requested.
+
+    A = [[a00, a01], [a10, a11]], b = [b0, b1], initial guess x = [x0, x1].
+    Returns the solution as a tuple (x0, x1).
     """
-    x = x_guess.copy()
+    tol_sq = tol * tol
     
     for _ in range(max_iter):
-        x_old_iter = x.copy()
-        
-        # Row 0: A[0,0]x[0] + A[0,1]x[1] = b[0]
-        # x[0] = (b[0] - A[0,1]x[1]) / A[0,0]
-        if abs(A[0,0]) > 1e-12:
-            x[0] = (b[0] - A[0,1] * x[1]) / A[0,0]
-            
-        # Row 1: A[1,0]x[0] + A[1,1]x[1] = b[1]
-        # x[1] = (b[1] - A[1,0]x[0]) / A[1,1]  <-- uses NEW x[0]
-        if abs(A[1,1]) > 1e-12:
-            x[1] = (b[1] - A[1,0] * x[0]) / A[1,1]
-            
-        if np.linalg.norm(x - x_old_iter) < tol:
-            return x
-            
-    return x # Return best effort
-
-
-def solve_newton_gs(u_old, dt, t_next, model, tol=1e-6, max_iter=20):
+        x0_old, x1_old = x0, x1
+
+        # Row 0: a00*x0 + a01*x1 = b0
+        # x0 = (b0 - a01*x1) / a00
+        if abs(a00) > 1e-12:
+            x0 = (b0 - a01 * x1) / a00
+
+        # Row 1: a10*x0 + a11*x1 = b1
+        # x1 = (b1 - a10*x0) / a11  <-- uses NEW x0
+        if abs(a11) > 1e-12:
+            x1 = (b1 - a10 * x0) / a11
+
+        dx = x0 - x0_old
+        dy = x1 - x1_old
+        if dx * dx + dy * dy < tol_sq:
+            return x0, x1
+
+    return x0, x1 # Return best effort
+
+
+def solve_2x2_direct(a00, a01, a10, a11, b0, b1):
     """
-    Solves the implicit equation F(u) = 0 using Newton's method.
-    The linear system J*delta = -F is solved via Gauss-Seidel.
+    Solves Ax = b exactly for a 2x2 system using Cramer's rule.
+    Falls back to gauss_seidel_2x2_solve when A is (nearly) singular
+    relative to the size of its entries.
+    """
+    det = a00 * a11 - a01 * a10
+    scale = max(abs(a00), abs(a01), abs(a10), abs(a11))
+    if abs(det) <= 1e-14 * scale * scale:
+        return gauss_seidel_2x2_solve(a00, a01, a10, a11, b0, b1)
     
+    x0 = (a11 * b0 - a01 * b1) / det
+    x1 = (a00 * b1 - a10 * b0) / det
+    return x0, x1
+
+
+def solve_newton_gs(u_old, dt, t_next, model, tol=1e-6, max_iter=20, linear_solver='direct', u_guess=None):
+    """
+    Solves the implicit equation F(u) = 0 using Newton's method.
+    The linear system J*delta = -F is solved in closed form by default
+    (linear_solver='direct'); linear_solver='gauss_seidel' uses the manual
+    Gauss-Seidel iteration from the assignment instead.
+    u_guess is the initial iterate (defaults to u_old).
+
     F(u) = u - u_old - dt * f(t_next, u)
     J_F(u) = I - dt * J_f(u, t_next)
-    """
-    u_guess = u_old.copy() # Initial guess
     
+    Returns (u_next, iters, converged) like solve_fixed_point.
+    """
+    h_old, v_old = u_old
+    h_g, v_g = u_old if u_guess is None else u_guess # Initial guess
+    tol_sq = tol * tol
+
     iters = 0
     converged = False
-    
-    inner_iters_total = 0
-    
+
     for i in range(max_iter):
         iters += 1
-        
+
         # 1. Compute Residual F(u)
         # F = u - u_old - dt * f(t, u)
-        f_val = model.f(t_next, u_guess)
-        F = u_guess - u_old - dt * f_val
-        
+        # f and J_f come from one fused model call (one sqrt, one exp)
+        dh_dt, dv_dt, j00, j01, j10, j11 = model.f_and_jacobian_scalar(t_next, h_g, v_g)
+        F0 = h_g - h_old - dt * dh_dt
+        F1 = v_g - v_old - dt * dv_dt
+
         # Check if F is close to 0 (residual check)
-        if np.linalg.norm(F) < tol:
+        # Not on the first iteration with an extrapolated u_guess: it is always
+        # refined by at least one Newton update, otherwise its error accumulates
+        if (iters > 1 or u_guess is None) and F0 * F0 + F1 * F1 < tol_sq:
             converged = True
             break
-            
-        # 2. Compute Jacobian J_F = I - dt * J_f
-        J_f = model.jacobian(t_next, u_guess)
-        J_F = np.eye(2) - dt * J_f
-        
-        # 3. Solve J_F * delta = -F using Gauss-Seidel
-        # Initial guess for delta is 0
-        delta_guess = np.zeros(2)
-        delta = gauss_seidel_2x2_solve(J_F, -F, delta_guess)
-        
+
+        # 2. Jacobian J_F = I - dt * J_f, entry by entry
+        # J_f = [[-a/sqrt(h), Q_max/A], [k_valve*dvt_dh, -k_valve]]
+        a00 = 1.0 - dt * j00
+        a01 = -dt * j01
+        a10 = -dt * j10
+        a11 = 1.0 - dt * j11
+
+        # 3. Solve J_F * delta = -F
+        if linear_solver == 'direct':
+            d0, d1 = solve_2x2_direct(a00, a01, a10, a11, -F0, -F1)
+        elif linear_solver == 'gauss_seidel':
+            # Initial guess for delta is 0
+            d0, d1 = gauss_seidel_2x2_solve(a00, a01, a10, a11, -F0, -F1)
+        else:
+            raise ValueError(f"Unknown linear solver: {linear_solver}")
+
         # 4. Update u
-        u_new = u_guess + delta
-        
+        h_g += d0
+        v_g += d1
+
         # Check step size convergence (optional but good)
-        if np.linalg.norm(u_new - u_guess) < tol:
+        if d0 * d0 + d1 * d1 < tol_sq:
             converged = True
-            u_guess = u_new
             break
-            
-        u_guess = u_new
-        
-    return u_guess, {'iters': iters, 'converged': converged}
+
+    return (h_g, v_g), iters, converged
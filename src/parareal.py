@@ -0,0 +1,117 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.fast import simulate_njit, FIXED_POINT, NEWTON_GS
+from src.nonlinear_solvers import solve_newton_gs
+from src.metrics import MetricsAccumulator
+
+FINE_METHODS = {'fixed_point': FIXED_POINT, 'newton_gs': NEWTON_GS}
+
+def _coarse_step(model, t_next, dt, u):
+    """
+    Coarse propagator G: a single Backward Euler step over the whole slice.
+    (Explicit Euler is unstable here: dt * k_valve is far above 2 for any useful slice length.)
+    """
+    u_next, _, _ = solve_newton_gs(u, dt, t_next, model)
+    return np.array(u_next)
+
+def parareal_simulate(model, t_span, u0, dt_fine, K, n_iter=3, method='newton_gs',
+                      relaxation=1.0, warm_start=True, tol=1e-8, max_workers=None):
+    """
+    Parallel-in-time Backward Euler using the Parareal iteration.
+    The interval is split into K slices. Each iteration runs the fine solver
+    (simulate_njit, which releases the GIL) on all slices concurrently, then
+    applies the serial correction
+        U^{k+1}_{n+1} = G(U^{k+1}_n) + F(U^k_n) - G(U^k_n)
+
+    Args:
+        model: CisternModel
+        t_span: (t_start, t_end)
+        u0: Initial state
+        dt_fine: Time step of the fine Backward Euler solver
+        K: Number of time slices (and worker threads by default)
+        n_iter: Max Parareal iterations (at most K are run, after K the
+                slice start values equal the serial fine solution)
+        method: Fine nonlinear solver, 'fixed_point' or 'newton_gs'
+        relaxation: Fixed-Point damping factor
+        warm_start: Warm-start the fine solves, see simulate_njit
+        tol: Stop early once the slice start values change less than this
+             (warns if n_iter is reached first)
+        max_workers: Thread pool size (default K)
+
+    Returns:
+        times: array of time points (N+1,)
+        states: array of states (N+1, 2)
+        metrics: MetricsAccumulator for the final fine sweep
+        parareal_iters: Number of Parareal iterations performed
+        correction: Max change of the slice start values in the last iteration
+    """
+    if method not in FINE_METHODS:
+        raise ValueError(f"Unknown nonlinear solver method: {method}")
+    method_flag = FINE_METHODS[method]
+    params = model.model_params()
+
+    t_start, t_end = t_span
+    n_steps = int(round((t_end - t_start) / dt_fine))
+    K = max(1, min(K, n_steps))
+
+    # Slice n covers fine steps bounds[n] .. bounds[n+1]
+    bounds = np.linspace(0, n_steps, K + 1).round().astype(int)
+    slice_t0 = t_start + dt_fine * bounds[:-1]
+    slice_dt = dt_fine * np.diff(bounds)
+
+    def fine(n, u, u_prev):
+        return simulate_njit(np.asarray(u, dtype=float), slice_t0[n], dt_fine,
+                             bounds[n + 1] - bounds[n], params, method_flag, relaxation,
+                             warm_start, np.asarray(u_prev, dtype=float))
+
+    # Initial guess for slice start values from a serial coarse sweep
+    U = np.empty((K + 1, 2))
+    U[0] = u0
+    G_old = np.empty((K, 2))
+    for n in range(K):
+        G_old[n] = _coarse_step(model, slice_t0[n] + slice_dt[n], slice_dt[n], U[n])
+        U[n + 1] = G_old[n]
+
+    # State one fine step before each slice start, so the fine warm start
+    # carries over slice boundaries (no history until the first fine sweep)
+    U_prev = U[:-1].copy()
+
+    parareal_iters = 0
+    change = np.inf
+    with ThreadPoolExecutor(max_workers=max_workers or K) as pool:
+        for _ in range(min(n_iter, K)):
+            parareal_iters += 1
+
+            # Fine solves on all slices in parallel
+            results = list(pool.map(fine, range(K), U[:-1], U_prev))
+            F_end = np.array([res[1][-1] for res in results])
+
+            # Serial correction sweep
+            U_new = np.empty_like(U)
+            U_new[0] = u0
+            for n in range(K):
+                G_new = _coarse_step(model, slice_t0[n] + slice_dt[n], slice_dt[n], U_new[n])
+                U_new[n + 1] = G_new + F_end[n] - G_old[n]
+                G_old[n] = G_new
+            for n in range(1, K):
+                U_prev[n] = results[n - 1][1][-2]
+
+            change = np.abs(U_new - U).max()
+            U = U_new
+            if change < tol:
+                break
+
+        # Assemble the trajectory from one last fine sweep
+        results = list(pool.map(fine, range(K), U[:-1], U_prev))
+
+    times = np.concatenate([results[0][0][:1]] + [res[0][1:] for res in results])
+    states = np.concatenate([results[0][1][:1]] + [res[1][1:] for res in results])
+    iters = np.concatenate([res[2] for res in results])
+    converged = np.concatenate([res[3] for res in results])
+
+    if change >= tol and parareal_iters < K:
+        warnings.warn(f"Parareal stopped at n_iter={n_iter} before reaching tol={tol:g} "
+                      f"(last correction {change:.3e})", RuntimeWarning)
+
+    return times, states, MetricsAccumulator.from_arrays(iters, converged), parareal_iters, change
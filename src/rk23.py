@@ -0,0 +1,131 @@
+import math
+import numpy as np
+from numba import njit
+from src.fast import f_njit
+from src.metrics import MetricsAccumulator
+
+# Step size controller
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 5.0
+DT_MIN = 1e-12
+EPS = np.finfo(np.float64).eps # the step floor also scales with |t|, see simulate_rk23_njit
+
+
+@njit(cache=True)
+def rk23_step(h, v, k1h, k1v, dt, params, atol, rtol):
+    """
+    One Bogacki-Shampine RK3(2) trial step of size dt from (h, v).
+    k1 = f(h, v) is passed in (FSAL: it is the k4 of the previous accepted step).
+
+    Returns:
+        (h_new, v_new, k4h, k4v, dt_new, accepted)
+        dt_new is the suggested size for the next (or retried) step.
+    """
+    k2h, k2v = f_njit(h + 0.5 * dt * k1h, v + 0.5 * dt * k1v, params)
+    k3h, k3v = f_njit(h + 0.75 * dt * k2h, v + 0.75 * dt * k2v, params)
+
+    h_new = h + dt * (2.0 / 9.0 * k1h + 1.0 / 3.0 * k2h + 4.0 / 9.0 * k3h)
+    v_new = v + dt * (2.0 / 9.0 * k1v + 1.0 / 3.0 * k2v + 4.0 / 9.0 * k3v)
+    k4h, k4v = f_njit(h_new, v_new, params)
+
+    # Difference to the embedded 2nd order solution
+    err_h = dt * (-5.0 / 72.0 * k1h + 1.0 / 12.0 * k2h + 1.0 / 9.0 * k3h - 0.125 * k4h)
+    err_v = dt * (-5.0 / 72.0 * k1v + 1.0 / 12.0 * k2v + 1.0 / 9.0 * k3v - 0.125 * k4v)
+    sc_h = atol + rtol * max(abs(h), abs(h_new))
+    sc_v = atol + rtol * max(abs(v), abs(v_new))
+    err = math.sqrt(0.5 * ((err_h / sc_h)**2 + (err_v / sc_v)**2))
+
+    if err == 0.0:
+        factor = MAX_FACTOR
+    else:
+        factor = min(MAX_FACTOR, max(MIN_FACTOR, SAFETY * err**(-1.0 / 3.0)))
+
+    return h_new, v_new, k4h, k4v, dt * factor, err <= 1.0
+
+
+@njit(cache=True)
+def simulate_rk23_njit(u0, t_start, t_end, dt0, params, atol, rtol):
+    """
+    Adaptive RK23 from t_start to t_end. Output arrays start at 1024 entries
+    and are doubled whenever they fill up.
+
+    Returns:
+        times: accepted time points (N+1,)
+        states: array (N+1, 2)
+        attempts: trial steps needed for each accepted step (N,), followed by
+                  the trials of the collapsed step if not ok (N+1,)
+        ok: False if the step size collapsed below max(DT_MIN, 10*eps*|t|)
+    """
+    cap = 1024
+    times = np.empty(cap)
+    states = np.empty((cap, 2))
+    attempts = np.empty(cap, dtype=np.int64)
+
+    t = t_start
+    h = u0[0]
+    v = u0[1]
+    times[0] = t
+    states[0, 0] = h
+    states[0, 1] = v
+    k1h, k1v = f_njit(h, v, params)
+
+    n = 0
+    dt = dt0
+    ok = True
+    while t < t_end:
+        # Below a few ulps of t, t + dt would round back to t
+        dt_min = max(DT_MIN, 10.0 * EPS * abs(t))
+        tries = 0
+        while True:
+            tries += 1
+            dt_try = min(dt, t_end - t)
+            h_new, v_new, k4h, k4v, dt, accepted = rk23_step(h, v, k1h, k1v, dt_try, params, atol, rtol)
+            if accepted or dt < dt_min:
+                break
+        t_new = t_end if dt_try == t_end - t else t + dt_try
+        if not accepted or t_new == t:
+            ok = False
+            attempts[n] = tries
+            break
+
+        if n + 2 > cap:
+            cap *= 2
+            times_new = np.empty(cap)
+            states_new = np.empty((cap, 2))
+            attempts_new = np.empty(cap, dtype=np.int64)
+            times_new[:n + 1] = times[:n + 1]
+            states_new[:n + 1] = states[:n + 1]
+            attempts_new[:n] = attempts[:n]
+            times, states, attempts = times_new, states_new, attempts_new
+
+        t = t_new
+        h = h_new
+        v = v_new
+        k1h = k4h
+        k1v = k4v
+        n += 1
+        times[n] = t
+        states[n, 0] = h
+        states[n, 1] = v
+        attempts[n - 1] = tries
+
+    n_attempts = n if ok else n + 1
+    return times[:n + 1].copy(), states[:n + 1].copy(), attempts[:n_attempts].copy(), ok
+
+
+def simulate_rk23(model, t_span, u0, dt, atol=1e-8, rtol=1e-6):
+    """
+    Adaptive explicit RK23 (Bogacki-Shampine) with the same return values as
+    integrators.simulate. dt is only the initial step size.
+    In the metrics, 'iters' is the number of trial steps per step and a failure
+    is the step whose size collapsed (the run stops there).
+    """
+    times, states, attempts, ok = simulate_rk23_njit(
+        np.asarray(u0, dtype=float), t_span[0], t_span[1], dt, model.model_params(), atol, rtol
+    )
+    n_accepted = len(times) - 1
+    metrics = MetricsAccumulator.from_arrays(attempts[:n_accepted])
+    if not ok:
+        metrics.add(int(attempts[n_accepted]), False)
+    return times, states, metrics
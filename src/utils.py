@@ -1,4 +1,6 @@
 import numpy as np
+import matplotlib
+matplotlib.use('Agg') # Scripts only save figures, skip GUI backend startup
 import matplotlib.pyplot as plt
 import os
 import csv
@@ -8,16 +10,17 @@ def ensure_dir(path):
     if not os.path.exists(path):
         os.makedirs(path)
 
-def save_metrics_csv(path, method_name, dt, metrics_list, runtime, final_h):
+def save_metrics_csv(path, method_name, dt, metrics, runtime, final_h):
     """
     Saves a summary row to a CSV file.
     Appends if exists.
+    metrics is a MetricsAccumulator.
     """
     file_exists = os.path.isfile(path)
     
-    avg_iters = np.mean([m['iters'] for m in metrics_list])
-    max_iters = np.max([m['iters'] for m in metrics_list])
-    failures = np.sum([0 if m['converged'] else 1 for m in metrics_list])
+    avg_iters = metrics.avg_iters
+    max_iters = metrics.max_iters
+    failures = metrics.failures
     
     fieldnames = ['Method', 'dt', 'Steps', 'Avg_Iters', 'Max_Iters', 'Runtime_s', 'Final_h', 'Failures_Count']
     
@@ -29,7 +32,7 @@ def save_metrics_csv(path, method_name, dt, metrics_list, runtime, final_h):
         writer.writerow({
             'Method': method_name,
             'dt': dt,
-            'Steps': len(metrics_list),
+            'Steps': metrics.n_steps,
             'Avg_Iters': f"{avg_iters:.4f}",
             'Max_Iters': max_iters,
             'Runtime_s': f"{runtime:.4f}",
@@ -37,16 +40,37 @@ def save_metrics_csv(path, method_name, dt, metrics_list, runtime, final_h):
             'Failures_Count': failures
         })
 
+def save_sweep_csv(path, params, states, iters, converged):
+    """
+    Saves one row per sweep run: its parameters and summary results.
+    params rows are in CisternModel.params_tuple() order.
+    """
+    fieldnames = ['Run', 'A', 'Q_max', 'h_target', 'k_valve', 'k_leak', 'width_s',
+                  'Avg_Iters', 'Max_Iters', 'Final_h', 'Failures_Count']
+    
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        for m in range(params.shape[0]):
+            writer.writerow(
+                [m] + list(params[m])
+                + [f"{iters[m].mean():.4f}", iters[m].max(), f"{states[m, -1, 0]:.4f}", int((~converged[m]).sum())]
+            )
+
 def save_simulation_results(save_dir, times, states, method_name):
     """Saves the full time series to CSV for human readability."""
     ensure_dir(save_dir)
     file_path = os.path.join(save_dir, f"results_{method_name}.csv")
     
-    with open(file_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Time', 'WaterHeight', 'ValveOpening'])
-        for t, s in zip(times, states):
-            writer.writerow([t, s[0], s[1]])
+    data = np.column_stack([times, states[:, 0], states[:, 1]])
+    np.savetxt(
+        file_path, 
+        data, 
+        delimiter=',', 
+        header='Time,WaterHeight,ValveOpening', 
+        comments='', 
+        fmt=('%.6f', '%.10e', '%.10e')
+    )
 
 def plot_results(times, states, method_name, save_dir):
     """Generates standard plots."""
@@ -55,38 +79,39 @@ def plot_results(times, states, method_name, save_dir):
     h = states[:, 0]
     v = states[:, 1]
     
+    # One figure/axes reused for all plots
+    fig, ax = plt.subplots(figsize=(8, 4))
+    
     # Plot 1: Height over time
-    plt.figure(figsize=(8, 4))
-    plt.plot(times, h, label='Water Height h(t)', color='blue')
-    plt.axhline(y=0.25, color='r', linestyle='--', label='Target 0.25m', alpha=0.5) # Hardcoded ref
-    plt.xlabel('Time (s)')
-    plt.ylabel('Height (m)')
-    plt.title(f'Cistern Filling - Height ({method_name})')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(os.path.join(save_dir, f'height_{method_name}.png'))
-    plt.close()
+    ax.plot(times, h, label='Water Height h(t)', color='blue')
+    ax.axhline(y=0.25, color='r', linestyle='--', label='Target 0.25m', alpha=0.5) # Hardcoded ref
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Height (m)')
+    ax.set_title(f'Cistern Filling - Height ({method_name})')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(os.path.join(save_dir, f'height_{method_name}.png'))
+    ax.clear()
     
     # Plot 2: Valve over time
-    plt.figure(figsize=(8, 4))
-    plt.plot(times, v, label='Valve Opening v(t)', color='green')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Opening Fraction')
-    plt.title(f'Valve Dynamics ({method_name})')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(os.path.join(save_dir, f'valve_{method_name}.png'))
-    plt.close()
+    ax.plot(times, v, label='Valve Opening v(t)', color='green')
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Opening Fraction')
+    ax.set_title(f'Valve Dynamics ({method_name})')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(os.path.join(save_dir, f'valve_{method_name}.png'))
+    ax.clear()
     
     # Plot 3: Phase Portrait
-    plt.figure(figsize=(6, 6))
-    plt.plot(h, v, color='purple')
-    plt.xlabel('Height (m)')
-    plt.ylabel('Valve Opening')
-    plt.title(f'Phase Portrait: v vs h ({method_name})')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(save_dir, f'phase_{method_name}.png'))
-    plt.close()
+    fig.set_size_inches(6, 6)
+    ax.plot(h, v, color='purple')
+    ax.set_xlabel('Height (m)')
+    ax.set_ylabel('Valve Opening')
+    ax.set_title(f'Phase Portrait: v vs h ({method_name})')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(os.path.join(save_dir, f'phase_{method_name}.png'))
+    plt.close(fig)